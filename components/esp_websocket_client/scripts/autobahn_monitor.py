@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2025 Espressif Systems (Shanghai) CO LTD
+# SPDX-License-Identifier: Apache-2.0
+"""
+Monitor an ESP32 running the websocket Autobahn test firmware over serial.
+
+The script sends the fuzzingserver URI to the board, mirrors the device log
+to stdout, reports `Case N/M` progress on stderr and exits once the
+completion pattern is seen (or the overall timeout expires).
+"""
+
+import argparse
+import logging
+import os
+import re
+import select
+import sys
+import time
+
+import serial
+
+# Status messages go through a logger rather than print(): %-style
+# formatting is deferred until the level check passes, and raising the
+# level silences the monitor chatter without touching the call sites
+log = logging.getLogger('autobahn_monitor')
+log.addHandler(logging.StreamHandler(sys.stderr))
+log.setLevel(logging.INFO)
+
+# Byte-level patterns: the device log is matched as raw bytes, so the
+# hot path never needs to decode it
+_TEST_CASE_RE = re.compile(rb'Case (\d+)/(\d+)')
+_DEFAULT_COMPLETION_PATTERN = r'All tests completed\.'
+_DEFAULT_COMPLETION_NEEDLE = b'All tests completed.'
+
+# Status heartbeat cadence: quicker while waiting for the first output
+_STATUS_INTERVAL_INITIAL = 10
+_STATUS_INTERVAL_NORMAL = 30
+
+# How long a single wait for serial data may take before the heartbeat
+# branch runs (select timeout on POSIX, serial read timeout elsewhere)
+_HEARTBEAT_TIMEOUT = 0.5
+
+# Multi-line hint blocks, emitted with one writelines() call each so the
+# stderr lock/flush is taken once per block instead of once per line
+_STARTUP_HINTS = (
+    '[If no output appears:]\n',
+    '  - Check the board is flashed with the websocket test app\n',
+    '  - Check the serial port and baud rate\n',
+    '  - Reset the board to restart the test run\n',
+)
+# ESP-IDF markers that show the board has booted far enough to accept
+# the URI on stdin; waiting for one beats a fixed post-reset sleep
+_BOOT_BANNERS = (b'cpu_start:', b'Returned from app_main')
+_BOOT_PROBE_TIMEOUT = 5.0
+
+_NO_OUTPUT_HINTS = (
+    '\n[Warning: No output received yet. Possible issues:]\n',
+    '  - ESP32 not configured with the correct server URI\n',
+    '  - ESP32 not connected to WiFi\n',
+    '  - Fuzzing server not reachable from the ESP32\n',
+    '  - Board needs a manual reset\n',
+)
+
+
+def _read_chunk(ser: serial.Serial, use_select: bool, fd: int) -> bytes:
+    """Wait up to _HEARTBEAT_TIMEOUT for serial data and drain it in one read."""
+    if use_select:
+        readable, _, _ = select.select([fd], [], [], _HEARTBEAT_TIMEOUT)
+        return os.read(fd, 65536) if readable else b''
+    head = ser.read(1)
+    if not head:
+        return b''
+    # Ask for a full line-sized batch rather than whatever in_waiting
+    # happened to report; a zero timeout keeps the read non-blocking so
+    # we only get what is there
+    ser.timeout = 0
+    raw = head + ser.read(max(ser.in_waiting, 4096))
+    ser.timeout = _HEARTBEAT_TIMEOUT
+    return raw
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run the Autobahn websocket test suite against an ESP32 and monitor its progress')
+    parser.add_argument('port', help='Serial port of the ESP32 (e.g. /dev/ttyUSB0)')
+    parser.add_argument('--baud', type=int, default=115200, help='Serial baud rate')
+    parser.add_argument('--uri', default='ws://localhost:9001', help='URI of the Autobahn fuzzingserver')
+    parser.add_argument('--completion-pattern', default=_DEFAULT_COMPLETION_PATTERN, help='Regex marking the end of the test run')
+    parser.add_argument('--timeout', type=int, default=2400, help='Overall timeout in seconds')
+    args = parser.parse_args()
+
+    # A plain-literal completion pattern (the common case) is matched with
+    # a C-level substring scan; the regex engine is only engaged when the
+    # user passed an actual regex
+    completion_needle = None
+    completion_pattern = None
+    if args.completion_pattern is _DEFAULT_COMPLETION_PATTERN:
+        completion_needle = _DEFAULT_COMPLETION_NEEDLE
+    elif not set('\\^$.|?*+()[]{}') & set(args.completion_pattern):
+        completion_needle = args.completion_pattern.encode()
+    else:
+        completion_pattern = re.compile(args.completion_pattern.encode())
+    # Sliding window for the completion scan: large enough for any match to
+    # fit, small enough that rescanning it on every chunk stays O(1) instead
+    # of rescanning the whole accumulated log
+    window = max(len(args.completion_pattern) * 4, 256)
+    tail = b''
+
+    # A short read timeout doubles as the heartbeat tick on the Windows
+    # fallback path: read(1) blocks until a byte arrives or it expires
+    ser = serial.Serial(args.port, args.baud, timeout=_HEARTBEAT_TIMEOUT)
+    # On POSIX let the kernel wake us when bytes arrive instead of
+    # round-tripping through pyserial's own wait loop
+    use_select = sys.platform != 'win32'
+    fd = ser.fileno() if use_select else -1
+
+    log.info('[Monitoring %s at %d baud]', args.port, args.baud)
+    sys.stderr.writelines(_STARTUP_HINTS)
+    sys.stderr.flush()
+
+    # Monotonic clock: the timeout and heartbeat math must not be thrown
+    # off by NTP adjustments of the wall clock
+    _clock = time.monotonic
+
+    # Boot log mirrored during the probe counts as activity, so a board
+    # that boots but then stalls gets the status line, not the bogus
+    # "no output received" warning
+    received_any_output = False
+
+    # Send the URI as soon as the boot banner shows the board is up
+    # instead of sleeping a fixed 5 s; on deadline, send it regardless
+    ready_deadline = _clock() + _BOOT_PROBE_TIMEOUT
+    boot_tail = b''
+    while _clock() < ready_deadline:
+        raw = _read_chunk(ser, use_select, fd)
+        if raw:
+            sys.stdout.buffer.write(raw)
+            sys.stdout.buffer.flush()
+            received_any_output = True
+            boot_tail = (boot_tail + raw)[-256:]
+            if any(banner in boot_tail for banner in _BOOT_BANNERS):
+                break
+    ser.write(f'{args.uri}\n'.encode('utf-8'))
+    ser.flush()
+    log.info('[Sent URI: %s]', args.uri)
+
+    start_time = _clock()
+    last_activity_time = start_time
+    last_status_time = start_time
+    exit_code = 1
+
+    try:
+        while True:
+            # One clock read per iteration; the timestamps below only feed
+            # multi-second interval checks, so sub-tick staleness is fine
+            now = _clock()
+            elapsed = now - start_time
+            if elapsed > args.timeout:
+                log.info('\n[Timeout: no completion after %d s]', args.timeout)
+                break
+
+            raw = _read_chunk(ser, use_select, fd)
+            if raw:
+                # Pass the log through as raw bytes: the terminal decodes
+                # it anyway, so no decode/re-encode round-trip is needed
+                sys.stdout.buffer.write(raw)
+                sys.stdout.buffer.flush()
+                received_any_output = True
+                last_activity_time = now
+
+                tail = (tail + raw)[-window:]
+
+                # Most chunks carry no progress line; a cheap substring scan
+                # decides whether the regex needs to run at all
+                idx = raw.find(b'Case ')
+                if idx != -1:
+                    match = _TEST_CASE_RE.search(raw, idx)
+                    if match:
+                        current_case, total_cases = int(match.group(1)), int(match.group(2))
+                        log.info('\n[Progress: Test case %d/%d (%d%%)]', current_case, total_cases, 100 * current_case // total_cases)
+
+                if completion_needle is not None:
+                    completed = completion_needle in tail
+                else:
+                    completed = completion_pattern.search(tail) is not None
+                if completed:
+                    log.info('\n[All test cases completed]')
+                    exit_code = 0
+                    break
+            else:
+                time_since_activity = now - last_activity_time
+                time_since_status = now - last_status_time
+                status_interval = _STATUS_INTERVAL_INITIAL if not received_any_output else _STATUS_INTERVAL_NORMAL
+
+                if time_since_status > status_interval:
+                    if not received_any_output:
+                        sys.stderr.writelines(_NO_OUTPUT_HINTS)
+                        sys.stderr.flush()
+                    elif time_since_activity > status_interval:
+                        log.info('\n[Status: %d s elapsed, %d s since last output]', int(elapsed), int(time_since_activity))
+                    last_status_time = now
+    finally:
+        ser.close()
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())